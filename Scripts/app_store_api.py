@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+"""App Store Connect API client for TestFlight automation.
+
+Thin wrapper around the App Store Connect REST API used by the
+TestFlight helper scripts (see status_utils.py). Authentication uses
+the same API key environment variables as fastlane/Appfile:
+
+    APP_STORE_CONNECT_API_KEY_ID
+    APP_STORE_CONNECT_API_ISSUER_ID
+    APP_STORE_CONNECT_API_KEY_PATH
+"""
+
+import functools
+import os
+import time
+from typing import Any
+
+import jwt
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+except ImportError:  # pragma: no cover - exercised only without cryptography
+    load_pem_private_key = None
+
+API_BASE_URL = "https://api.appstoreconnect.apple.com/v1"
+DEFAULT_BUNDLE_ID = "com.leavn.superofficial"
+
+# Shared connection pool: every client reuses keep-alive TLS connections
+# to api.appstoreconnect.apple.com, with retries/backoff for transient
+# server errors and rate limiting.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+# Apple allows up to 20 minutes; stay comfortably inside that.
+TOKEN_LIFETIME_SECONDS = 15 * 60
+
+
+@functools.cache
+def _load_signing_key(path: str) -> Any:
+    """Read and parse the ES256 private key at path, once per process.
+
+    Cached at module scope so every client instance pointing at the same
+    key file shares one disk read and one PEM/ASN.1 parse. Falls back to
+    the raw PEM text when cryptography is unavailable; PyJWT parses it
+    per signature in that case.
+    """
+    with open(path, "rb") as f:
+        pem = f.read()
+    if load_pem_private_key is not None:
+        return load_pem_private_key(pem, password=None)
+    return pem.decode()
+
+
+class AppStoreConnectAPI:
+    """Authenticated client for the App Store Connect REST API."""
+
+    def __init__(
+        self,
+        key_id: str | None = None,
+        issuer_id: str | None = None,
+        private_key_path: str | None = None,
+    ):
+        self.key_id = key_id or os.environ.get("APP_STORE_CONNECT_API_KEY_ID", "")
+        self.issuer_id = issuer_id or os.environ.get("APP_STORE_CONNECT_API_ISSUER_ID", "")
+        self.private_key_path = private_key_path or os.environ.get(
+            "APP_STORE_CONNECT_API_KEY_PATH",
+            os.path.expanduser(f"~/.private_keys/AuthKey_{self.key_id}.p8"),
+        )
+        # Defaults to the module-wide pooled session; tests can inject
+        # their own.
+        self.session: requests.Session = _SESSION
+        self._token: str | None = None
+        self._token_exp = 0.0
+
+    def validate_credentials(self) -> bool:
+        """Return True if the key id, issuer id, and key file are all present."""
+        return bool(self.key_id and self.issuer_id and os.path.isfile(self.private_key_path))
+
+    def _get_signing_key(self) -> Any:
+        """Return the private key for ES256 signing via the process-wide cache."""
+        return _load_signing_key(self.private_key_path)
+
+    def generate_jwt_token(self) -> str:
+        """Generate a short-lived ES256 JWT for the App Store Connect API.
+
+        The token is cached until shortly before its exp claim, so bulk
+        flows don't re-run ECDSA signing on every request.
+        """
+        now = time.time()
+        if self._token is not None and now < self._token_exp - 30:
+            return self._token
+        payload = {
+            "iss": self.issuer_id,
+            "iat": int(now),
+            "exp": int(now) + TOKEN_LIFETIME_SECONDS,
+            "aud": "appstoreconnect-v1",
+        }
+        self._token = jwt.encode(
+            payload,
+            self._get_signing_key(),
+            algorithm="ES256",
+            headers={"kid": self.key_id},
+        )
+        self._token_exp = now + TOKEN_LIFETIME_SECONDS
+        return self._token
+
+    def _make_request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Issue an authenticated GET against the API and return the parsed JSON."""
+        headers = {"Authorization": f"Bearer {self.generate_jwt_token()}"}
+        response = self.session.get(
+            f"{API_BASE_URL}/{endpoint}",
+            headers=headers,
+            params=params,
+            timeout=30,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def get_app_id(self, bundle_id: str = DEFAULT_BUNDLE_ID) -> str | None:
+        """Resolve a bundle identifier to its App Store Connect app id."""
+        data = self._make_request("apps", params={"filter[bundleId]": bundle_id})
+        apps = data.get("data", [])
+        return apps[0]["id"] if apps else None
+
+    def get_latest_build(self, app_id: str) -> dict[str, Any] | None:
+        """Return the most recently uploaded build for an app, if any."""
+        data = self._make_request(
+            "builds",
+            params={
+                "filter[app]": app_id,
+                "sort": "-uploadedDate",
+                "limit": 1,
+            },
+        )
+        builds = data.get("data", [])
+        return builds[0] if builds else None
+
+
+# Convenience functions for one-off use from other scripts.
+
+def generate_jwt_token() -> str:
+    return AppStoreConnectAPI().generate_jwt_token()
+
+
+@functools.lru_cache(maxsize=32)
+def get_app_id(bundle_id: str = DEFAULT_BUNDLE_ID) -> str | None:
+    # bundle_id -> app_id is stable, so repeated convenience calls are free.
+    return AppStoreConnectAPI().get_app_id(bundle_id)
+
+
+def get_latest_build(app_id: str) -> dict[str, Any] | None:
+    return AppStoreConnectAPI().get_latest_build(app_id)
@@ -0,0 +1,884 @@
+#!/usr/bin/env python3
+
+"""TestFlight status utilities for the Leavn project.
+
+Provides colored terminal output, progress tracking, build/invitation
+status checks against App Store Connect, and report generation. Used by
+the TestFlight helper scripts and runnable directly:
+
+    python3 Scripts/status_utils.py
+"""
+
+import asyncio
+import dataclasses
+import functools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without aiohttp
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+from app_store_api import API_BASE_URL, DEFAULT_BUNDLE_ID, AppStoreConnectAPI
+
+
+class Colors:
+    """ANSI escape codes for terminal output."""
+
+    RED = "\033[0;31m"
+    GREEN = "\033[0;32m"
+    YELLOW = "\033[1;33m"
+    BLUE = "\033[0;34m"
+    CYAN = "\033[0;36m"
+    WHITE = "\033[0;37m"
+    BOLD = "\033[1m"
+    RESET = "\033[0m"
+
+
+# Honor the NO_COLOR convention and skip ANSI escapes entirely when output
+# is piped (CI logs, redirects); checked once at import time.
+_USE_COLOR = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+
+if not _USE_COLOR:
+    for _attr in list(vars(Colors)):
+        if not _attr.startswith("_"):
+            setattr(Colors, _attr, "")
+
+
+class StatusType(Enum):
+    SUCCESS = "success"
+    ERROR = "error"
+    WARNING = "warning"
+    INFO = "info"
+    PROGRESS = "progress"
+
+
+# Built once at import; these are hit from inside per-email loops, where
+# rebuilding a five-entry dict per call is pure waste.
+_STATUS_COLORS = {
+    StatusType.SUCCESS: Colors.GREEN,
+    StatusType.ERROR: Colors.RED,
+    StatusType.WARNING: Colors.YELLOW,
+    StatusType.INFO: Colors.BLUE,
+    StatusType.PROGRESS: Colors.CYAN,
+}
+
+_STATUS_ICONS = {
+    StatusType.SUCCESS: "✅",
+    StatusType.ERROR: "❌",
+    StatusType.WARNING: "⚠️",
+    StatusType.INFO: "ℹ️",
+    StatusType.PROGRESS: "🔄",
+}
+
+
+def colorize_text(text: str, status_type: StatusType) -> str:
+    """Wrap text in the ANSI color for the given status type."""
+    if not _USE_COLOR:
+        # True no-op when colors are off (pipes, CI, NO_COLOR): return
+        # the input unchanged instead of formatting with empty escapes.
+        return text
+    color = _STATUS_COLORS.get(status_type, Colors.WHITE)
+    return f"{color}{text}{Colors.RESET}"
+
+
+def print_status_message(message: str, status_type: StatusType = StatusType.INFO) -> None:
+    """Print a message with a status icon and matching color."""
+    icon = _STATUS_ICONS.get(status_type, "")
+    print(f"{icon} {colorize_text(message, status_type)}")
+
+
+@dataclass(slots=True, frozen=True)
+class BuildStatus:
+    """Snapshot of a TestFlight build's processing state."""
+
+    build_id: str
+    version: str
+    build_number: str
+    processing_state: str
+    uploaded_date: datetime
+    age_hours: float = 0.0
+
+
+@dataclass(slots=True, frozen=True)
+class InvitationStatus:
+    """Snapshot of a beta tester's invitation state for one email."""
+
+    email: str
+    status: str
+    tester_id: str | None
+    invited_date: datetime | None
+    last_checked: datetime
+
+
+@dataclass(slots=True)
+class ProcessingProgress:
+    """Counters for a batch operation, with timing helpers."""
+
+    total: int
+    processed: int = 0
+    successful: int = 0
+    failed: int = 0
+    warnings: int = 0
+    start_time: datetime = field(default_factory=datetime.now)
+    # Monotonic baseline for timing math; a float subtraction beats the
+    # datetime.now() + timedelta path on every elapsed/ETA read.
+    _start_monotonic: float = field(default_factory=time.monotonic)
+
+    @property
+    def percentage(self) -> float:
+        return (self.processed / self.total * 100) if self.total else 100.0
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self._start_monotonic
+
+    @property
+    def estimated_remaining_seconds(self) -> float:
+        if self.processed == 0:
+            return 0.0
+        return (self.total - self.processed) * self.elapsed_seconds / self.processed
+
+
+class ProgressBar:
+    """Terminal progress bar with success/failure counters and an ETA."""
+
+    # Redraw only when enough time has passed AND the bar moved at least
+    # a percent; terminal writes dominate fast loops.
+    MIN_REDRAW_INTERVAL = 0.1
+    MIN_REDRAW_PERCENT = 1.0
+
+    def __init__(self, total: int, width: int = 50, clock=time.monotonic):
+        self.total = total
+        self.width = width
+        # Injectable clock so tests can drive the redraw throttle with a
+        # fake time source instead of real sleeps.
+        self._clock = clock
+        self.progress = ProcessingProgress(total=total)
+        self._last_render = 0.0
+        self._last_pct = -1.0
+        # Counter updates may come from worker threads; the lock only
+        # covers the field stores and snapshotting, never rendering.
+        self._lock = threading.Lock()
+        # ETA comes from an exponential moving average of per-item time:
+        # one multiply per tick, and a single slow API call no longer
+        # whipsaws the estimate the way total-elapsed extrapolation does.
+        self._ema_dt = 0.0
+        self._alpha = 0.2
+        self._last_t: float | None = None
+        self._stop_event = threading.Event()
+        self._render_thread: threading.Thread | None = None
+        # Precompose the colored bar for every possible fill level and the
+        # counter templates, so render() only does lookups and %-fills.
+        self._bars = [
+            f"{Colors.GREEN}{'█' * k}{Colors.RESET}"
+            f"{Colors.WHITE}{'░' * (width - k)}{Colors.RESET}"
+            for k in range(width + 1)
+        ]
+        self._counters_fmt = (
+            f"{Colors.GREEN}%d ✓{Colors.RESET} "
+            f"{Colors.RED}%d ✗{Colors.RESET} "
+            f"{Colors.YELLOW}%d ⚠{Colors.RESET}"
+        )
+
+    def update(
+        self,
+        processed: int = 0,
+        successful: int = 0,
+        failed: int = 0,
+        warnings: int = 0,
+    ) -> None:
+        """Add the given deltas to the counters.
+
+        Deltas keep callers free of read-modify-write cycles on shared
+        state, which also makes concurrent updates race-free.
+        """
+        now = self._clock()
+        with self._lock:
+            self.progress.processed += processed
+            self.progress.successful += successful
+            self.progress.failed += failed
+            self.progress.warnings += warnings
+            if processed:
+                if self._last_t is not None:
+                    dt = (now - self._last_t) / processed
+                    self._ema_dt = (
+                        self._alpha * dt + (1 - self._alpha) * self._ema_dt
+                        if self._ema_dt
+                        else dt
+                    )
+                self._last_t = now
+
+    def render(self, progress: ProcessingProgress | None = None) -> str:
+        """Build the progress bar line for the given (or current) counters."""
+        if progress is None:
+            progress = self.progress
+        filled_width = int(self.width * progress.processed / self.total) if self.total else self.width
+        bar = self._bars[filled_width]
+        counters = self._counters_fmt % (
+            progress.successful,
+            progress.failed,
+            progress.warnings,
+        )
+        eta = self._ema_dt * (self.total - progress.processed)
+        return (
+            f"[{bar}] {progress.percentage:5.1f}% "
+            f"({progress.processed}/{self.total}) {counters} "
+            f"ETA {eta:4.0f}s"
+        )
+
+    def print_progress(self) -> None:
+        """Redraw the progress bar in place, throttled to the redraw interval.
+
+        The final tick always renders so the bar ends at 100%.
+        """
+        now = self._clock()
+        with self._lock:
+            snapshot = dataclasses.replace(self.progress)
+        done = snapshot.processed >= self.total
+        pct = snapshot.percentage
+        # Skip unless BOTH gates pass: enough time elapsed and at least
+        # a percent of movement. Either one alone must not force a
+        # repaint.
+        if not done and (
+            now - self._last_render < self.MIN_REDRAW_INTERVAL
+            or pct - self._last_pct < self.MIN_REDRAW_PERCENT
+        ):
+            return
+        self._last_render = now
+        self._last_pct = pct
+        # One write + one flush per frame instead of print()'s per-arg path.
+        out = f"\r{self.render(snapshot)}"
+        if done:
+            out += "\n"
+        sys.stdout.write(out)
+        sys.stdout.flush()
+
+    def start(self, refresh_interval: float = 0.1) -> None:
+        """Start a daemon thread that redraws the bar periodically.
+
+        Workers then only bump counters via update(); no terminal I/O
+        happens on their hot path.
+        """
+        if self._render_thread is not None:
+            return
+        self._stop_event.clear()
+        self._render_thread = threading.Thread(
+            target=self._render_loop, args=(refresh_interval,), daemon=True
+        )
+        self._render_thread.start()
+
+    def stop(self) -> None:
+        """Stop the render thread and draw the final state."""
+        if self._render_thread is None:
+            return
+        self._stop_event.set()
+        self._render_thread.join()
+        self._render_thread = None
+        self.print_progress()
+
+    def _render_loop(self, refresh_interval: float) -> None:
+        while not self._stop_event.is_set():
+            self.print_progress()
+            self._stop_event.wait(refresh_interval)
+
+
+class TokenBucket:
+    """Token-bucket rate limiter for API calls.
+
+    Fills at ``rate`` tokens per second up to ``capacity``; acquire()
+    only blocks once the bucket is empty, so requests inside the budget
+    go through without artificial delay. stall() pauses handouts, e.g.
+    to honor a Retry-After header after an HTTP 429.
+    """
+
+    def __init__(self, rate: float = 10.0, capacity: int = 20):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_fill = time.monotonic()
+        self._stalled_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._stalled_until:
+                    self._tokens = min(
+                        self.capacity, self._tokens + (now - self._last_fill) * self.rate
+                    )
+                    self._last_fill = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    wait = (1.0 - self._tokens) / self.rate
+                else:
+                    wait = self._stalled_until - now
+            time.sleep(wait)
+
+    def stall(self, seconds: float) -> None:
+        """Hand out no tokens for the given number of seconds."""
+        with self._lock:
+            self._stalled_until = max(self._stalled_until, time.monotonic() + seconds)
+
+
+class StatusChecker:
+    """Checks TestFlight build and tester invitation status."""
+
+    # How long a fetched build record stays fresh; polling loops inside
+    # this window reuse the prior response instead of hitting the API.
+    BUILD_CACHE_TTL = 30.0
+    # Concurrency cap for the async invitation fan-out.
+    MAX_CONCURRENT_CHECKS = 64
+    # /betaTesters accepts up to 200 comma-separated filter[email] values.
+    BATCH_SIZE = 200
+
+    def __init__(self, api_client: AppStoreConnectAPI | None = None):
+        self.api_client = api_client or AppStoreConnectAPI()
+        # bundle_id -> app_id never changes, so a plain LRU is safe.
+        self._get_app_id = functools.lru_cache(maxsize=32)(self.api_client.get_app_id)
+        self.rate_limiter = TokenBucket()
+        self._build_cache: dict[str, tuple[float, dict[str, Any] | None]] = {}
+
+    def _get_latest_build(self, app_id: str) -> dict[str, Any] | None:
+        """Fetch the latest build, reusing a recent response within the TTL.
+
+        Parses the uploaded date once here so callers (including the
+        wait_for_build_ready polling loop) never reparse the ISO string.
+        """
+        cached = self._build_cache.get(app_id)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        build = self.api_client.get_latest_build(app_id)
+        if build is not None:
+            uploaded = build["attributes"].get("uploadedDate")
+            build["_uploaded_date_dt"] = (
+                datetime.fromisoformat(uploaded.replace("Z", "+00:00")) if uploaded else None
+            )
+        self._build_cache[app_id] = (time.monotonic() + self.BUILD_CACHE_TTL, build)
+        return build
+
+    def check_build_status(self, bundle_id: str = DEFAULT_BUNDLE_ID) -> BuildStatus | None:
+        """Fetch the latest build for the app and summarize its state."""
+        app_id = self._get_app_id(bundle_id)
+        if app_id is None:
+            print_status_message(f"No app found for {bundle_id}", StatusType.ERROR)
+            return None
+
+        build = self._get_latest_build(app_id)
+        if build is None:
+            print_status_message("No builds found", StatusType.WARNING)
+            return None
+
+        attributes = build["attributes"]
+        uploaded_date = build["_uploaded_date_dt"]
+        age_hours = (
+            (datetime.now(timezone.utc) - uploaded_date).total_seconds() / 3600
+            if uploaded_date
+            else 0.0
+        )
+        return BuildStatus(
+            build_id=build["id"],
+            version=attributes.get("version", ""),
+            build_number=attributes.get("version", ""),
+            # Interned: the same handful of state strings recurs across
+            # polls, so repeated snapshots share one object and compare
+            # by identity.
+            processing_state=sys.intern(attributes.get("processingState", "UNKNOWN")),
+            uploaded_date=uploaded_date,
+            age_hours=age_hours,
+        )
+
+    def _tester_map_from_response(self, data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """Index a /betaTesters response by lower-cased email.
+
+        Each tester record gets an _app_ids list pulled from its apps
+        relationship so association checks stay local.
+        """
+        testers: dict[str, dict[str, Any]] = {}
+        for tester in data.get("data", []):
+            email = tester.get("attributes", {}).get("email", "")
+            related = tester.get("relationships", {}).get("apps", {}).get("data") or []
+            tester["_app_ids"] = [item["id"] for item in related]
+            testers[email.lower()] = tester
+        return testers
+
+    def _find_testers_by_emails(self, emails: list[str]) -> dict[str, dict[str, Any]]:
+        """Look up a whole batch of testers in a single request.
+
+        /betaTesters accepts comma-separated filter[email] values, so up
+        to BATCH_SIZE testers cost one round trip instead of one each.
+        """
+        data = self.api_client._make_request(
+            "betaTesters",
+            params={
+                "filter[email]": ",".join(emails),
+                "include": "apps",
+                "fields[apps]": "bundleId",
+                "limit": self.BATCH_SIZE,
+            },
+        )
+        return self._tester_map_from_response(data)
+
+    @staticmethod
+    def _status_from_lookup(
+        email: str, app_id: str | None, tester: dict[str, Any] | None, checked_at: datetime
+    ) -> InvitationStatus:
+        """Turn one tester lookup result into an InvitationStatus."""
+        if tester is None:
+            return InvitationStatus(
+                email=email,
+                status="not_invited",
+                tester_id=None,
+                invited_date=None,
+                last_checked=checked_at,
+            )
+        return InvitationStatus(
+            email=email,
+            status="invited" if app_id in tester["_app_ids"] else "not_invited",
+            tester_id=tester["id"],
+            invited_date=None,
+            last_checked=checked_at,
+        )
+
+    def check_invitation_status(
+        self, emails: list[str], bundle_id: str = DEFAULT_BUNDLE_ID
+    ) -> "StatusAccumulator":
+        """Check the invitation status of each email for the given app.
+
+        Emails are looked up in batches of BATCH_SIZE through a single
+        filter[email] request per batch, so N testers cost ceil(N/200)
+        round trips. Multiple batches are fetched concurrently through
+        aiohttp when it is installed. The returned StatusAccumulator is
+        a plain list of InvitationStatus that also carries per-status
+        counts, tallied while the list is built.
+        """
+        app_id = self._get_app_id(bundle_id)
+        chunks = [
+            emails[i : i + self.BATCH_SIZE] for i in range(0, len(emails), self.BATCH_SIZE)
+        ]
+        progress = ProgressBar(total=len(emails))
+        progress.start()
+        try:
+            # Progress advances as each chunk fetch lands — the network
+            # wait is where the time goes, and the bar should show it.
+            if aiohttp is not None and len(chunks) > 1:
+                tester_maps = asyncio.run(self._fetch_chunks_async(chunks, progress))
+            else:
+                tester_maps = []
+                for chunk in chunks:
+                    testers = self._fetch_chunk_sync(chunk)
+                    tester_maps.append(testers)
+                    self._update_chunk_progress(progress, chunk, testers)
+
+            statuses = StatusAccumulator()
+            # One timestamp for the whole batch; datetime.now() is a
+            # syscall and per-email freshness is meaningless here.
+            checked_at = datetime.now()
+            for chunk, testers in zip(chunks, tester_maps):
+                if testers is None:
+                    for email in chunk:
+                        statuses.add(
+                            InvitationStatus(
+                                email=email,
+                                status="error",
+                                tester_id=None,
+                                invited_date=None,
+                                last_checked=checked_at,
+                            )
+                        )
+                    continue
+                for email in chunk:
+                    statuses.add(
+                        self._status_from_lookup(
+                            email, app_id, testers.get(email.lower()), checked_at
+                        )
+                    )
+        finally:
+            progress.stop()
+        return statuses
+
+    @staticmethod
+    def _update_chunk_progress(
+        progress: ProgressBar, chunk: list[str], testers: dict[str, Any] | None
+    ) -> None:
+        """Count a fetched chunk's emails as succeeded or failed."""
+        if testers is None:
+            progress.update(processed=len(chunk), failed=len(chunk))
+        else:
+            progress.update(processed=len(chunk), successful=len(chunk))
+
+    def _fetch_chunk_sync(self, chunk: list[str]) -> dict[str, dict[str, Any]] | None:
+        """Fetch one batch through the pooled session; None on failure."""
+        try:
+            self.rate_limiter.acquire()
+            return self._find_testers_by_emails(chunk)
+        except Exception as exc:
+            if (
+                isinstance(exc, requests.HTTPError)
+                and exc.response is not None
+                and exc.response.status_code == 429
+            ):
+                retry_after = exc.response.headers.get("Retry-After", "60")
+                try:
+                    seconds = float(retry_after)
+                except ValueError:
+                    # Retry-After may also be an HTTP-date (RFC 9110);
+                    # a fixed stall beats crashing the sweep over it.
+                    seconds = 60.0
+                self.rate_limiter.stall(seconds)
+            return None
+
+    async def _fetch_chunks_async(
+        self, chunks: list[list[str]], progress: ProgressBar
+    ) -> list[dict[str, dict[str, Any]] | None]:
+        # One Bearer token and one pooled session shared by every batch.
+        headers = {"Authorization": f"Bearer {self.api_client.generate_jwt_token()}"}
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT_CHECKS)
+        connector = aiohttp.TCPConnector(limit_per_host=self.MAX_CONCURRENT_CHECKS)
+
+        async def fetch(chunk: list[str]) -> dict[str, dict[str, Any]] | None:
+            testers = await self._fetch_chunk_async(session, sem, chunk)
+            self._update_chunk_progress(progress, chunk, testers)
+            return testers
+
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            return list(await asyncio.gather(*(fetch(chunk) for chunk in chunks)))
+
+    async def _fetch_chunk_async(
+        self,
+        session: "aiohttp.ClientSession",
+        sem: asyncio.Semaphore,
+        chunk: list[str],
+    ) -> dict[str, dict[str, Any]] | None:
+        params = {
+            "filter[email]": ",".join(chunk),
+            "include": "apps",
+            "fields[apps]": "bundleId",
+            "limit": self.BATCH_SIZE,
+        }
+        async with sem:
+            for attempt in range(5):
+                try:
+                    async with session.get(
+                        f"{API_BASE_URL}/betaTesters", params=params
+                    ) as response:
+                        if response.status == 429:
+                            try:
+                                retry_after = float(
+                                    response.headers.get("Retry-After", 2**attempt)
+                                )
+                            except ValueError:
+                                retry_after = float(2**attempt)
+                            await asyncio.sleep(retry_after + random.uniform(0, 1))
+                            continue
+                        response.raise_for_status()
+                        return self._tester_map_from_response(await response.json())
+                except aiohttp.ClientError:
+                    if attempt == 4:
+                        break
+                    await asyncio.sleep(2**attempt + random.uniform(0, 1))
+        return None
+
+    def wait_for_build_ready(
+        self,
+        bundle_id: str = DEFAULT_BUNDLE_ID,
+        timeout: int = 1800,
+        initial_interval: float = 15.0,
+        max_interval: float = 300.0,
+    ) -> BuildStatus | None:
+        """Poll until the latest build finishes processing or timeout expires.
+
+        Polls with capped exponential backoff (15s, 30s, 60s, ... up to
+        max_interval) plus a small jitter, since processing usually takes
+        many minutes and a fixed short interval just burns round trips.
+        """
+        deadline = time.time() + timeout
+        interval = initial_interval
+        last_state = None
+        while time.time() < deadline:
+            build_status = self.check_build_status(bundle_id)
+            if build_status is None:
+                return None
+            if build_status.processing_state == "VALID":
+                print_status_message(
+                    f"Build {build_status.version} is ready", StatusType.SUCCESS
+                )
+                return build_status
+            if build_status.processing_state in ("FAILED", "INVALID"):
+                print_status_message(
+                    f"Build {build_status.version} failed processing", StatusType.ERROR
+                )
+                return build_status
+            if build_status.processing_state != last_state:
+                print_status_message(
+                    f"Build still processing ({build_status.processing_state})...",
+                    StatusType.PROGRESS,
+                )
+                last_state = build_status.processing_state
+            time.sleep(interval + random.uniform(0, interval * 0.1))
+            interval = min(max_interval, interval * 2)
+        print_status_message("Timed out waiting for build", StatusType.ERROR)
+        return None
+
+
+class StatusAccumulator(list):
+    """Invitation status list that tallies counts as items are added.
+
+    Status counts come out of the same pass that builds the list, so
+    consumers like ReportGenerator never need a second scan. Still a
+    plain list to every existing caller.
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.counts: defaultdict[str, int] = defaultdict(int)
+
+    def add(self, status: InvitationStatus) -> None:
+        self.append(status)
+        self.counts[status.status] += 1
+
+
+@dataclass(slots=True)
+class ReportSummary:
+    """Aggregate counts for one invitation sweep."""
+
+    total: int
+    invited: int
+    not_invited: int
+    errors: int
+
+
+@dataclass(slots=True)
+class Report:
+    """Typed status report; serialized directly as a dataclass.
+
+    Holding the BuildStatus and InvitationStatus objects themselves
+    (instead of flattening them into nested dicts up front) means the
+    invitation list is only walked once, by the serializer.
+    """
+
+    generated_at: datetime
+    build: BuildStatus | None
+    summary: ReportSummary
+    invitations: list[InvitationStatus]
+    additional_info: dict[str, Any] | None = None
+
+
+def _report_default(obj: Any) -> Any:
+    # Stdlib-encoder fallback: expand dataclasses, stringify the rest
+    # (datetimes).
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+
+class ReportGenerator:
+    """Builds and saves TestFlight status reports."""
+
+    def __init__(self, output_dir: str = "reports"):
+        # Create the directory once here instead of stat'ing it on every
+        # save; periodic report runs then never touch it again.
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def generate_report(
+        self,
+        build_status: BuildStatus | None,
+        invitation_statuses: list[InvitationStatus],
+        additional_info: dict[str, Any] | None = None,
+    ) -> Report:
+        """Assemble a Report from build and invitation status data."""
+        # A StatusAccumulator already counted while the list was built;
+        # only a bare list needs the counting pass here.
+        counts = getattr(invitation_statuses, "counts", None)
+        if counts is None:
+            counts = defaultdict(int)
+            for s in invitation_statuses:
+                counts[s.status] += 1
+        return Report(
+            generated_at=datetime.now(),
+            build=build_status,
+            summary=ReportSummary(
+                total=len(invitation_statuses),
+                invited=counts["invited"],
+                not_invited=counts["not_invited"],
+                errors=counts["error"],
+            ),
+            # Stored as a plain list: dataclasses.asdict rebuilds sequence
+            # fields via type(obj)(...), which a StatusAccumulator's
+            # no-argument constructor can't satisfy in the stdlib JSON
+            # fallback.
+            invitations=list(invitation_statuses),
+            additional_info=additional_info,
+        )
+
+    def save_report(
+        self,
+        report: Report,
+        filename: str | None = None,
+        format: str = "json",
+    ) -> str:
+        """Write a report to the output directory and return its path.
+
+        Writes go to a sibling temp file and are moved into place with
+        os.replace, so a crash mid-write never leaves a truncated report
+        behind.
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"testflight_report_{timestamp}.{format}"
+        filepath = self.output_dir / filename
+        tmp_path = f"{filepath}.tmp"
+
+        if format == "json":
+            if orjson is not None:
+                # orjson expands dataclasses and datetimes natively; the
+                # invitation list is walked exactly once, here.
+                with open(tmp_path, "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            report,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS,
+                        )
+                    )
+            else:
+                # Stream chunks instead of json.dump's build-the-whole-
+                # string-first path, keeping peak memory flat for large
+                # invitation lists.
+                encoder = json.JSONEncoder(indent=2, default=_report_default)
+                with open(tmp_path, "w") as f:
+                    for chunk in encoder.iterencode(report):
+                        f.write(chunk)
+        else:
+            with open(tmp_path, "w") as f:
+                self._write_text_report(report, f)
+        os.replace(tmp_path, filepath)
+        return str(filepath)
+
+    def _write_text_report(self, report: Report, file) -> None:
+        # Collect the lines and issue a single write; ~20 small write()
+        # calls each pay Python I/O-stack overhead for no benefit.
+        build = report.build
+        summary = report.summary
+        parts = [
+            "TestFlight Status Report\n",
+            "========================\n",
+            "\n",
+            f"Generated: {report.generated_at}\n",
+            "\n",
+            "Build\n",
+            "-----\n",
+            f"Version: {build.version if build else None}\n",
+            f"Build number: {build.build_number if build else None}\n",
+            f"Processing state: {build.processing_state if build else None}\n",
+            f"Uploaded: {build.uploaded_date if build else None}\n",
+            "\n",
+            "Invitations\n",
+            "-----------\n",
+            f"Total: {summary.total}\n",
+            f"Invited: {summary.invited}\n",
+            f"Not invited: {summary.not_invited}\n",
+            f"Errors: {summary.errors}\n",
+            "\n",
+        ]
+        buckets: dict[str, list[str]] = defaultdict(list)
+        for s in report.invitations:
+            buckets[s.status].append(s.email)
+        for status, label in (("invited", "invited"), ("not_invited", "not_invited"), ("error", "errors")):
+            emails = buckets[status]
+            if emails:
+                parts.append(f"{label}:\n")
+                parts.extend(f"  - {email}\n" for email in emails)
+        file.write("".join(parts))
+
+
+# Convenience functions for one-off use from other scripts.
+
+def check_build_status(bundle_id: str = DEFAULT_BUNDLE_ID) -> BuildStatus | None:
+    return StatusChecker().check_build_status(bundle_id)
+
+
+def check_invitation_status(
+    emails: list[str], bundle_id: str = DEFAULT_BUNDLE_ID
+) -> list[InvitationStatus]:
+    return StatusChecker().check_invitation_status(emails, bundle_id)
+
+
+def generate_status_report(
+    build_status: BuildStatus | None,
+    invitation_statuses: list[InvitationStatus],
+    output_dir: str = "reports",
+) -> str:
+    generator = ReportGenerator(output_dir)
+    report = generator.generate_report(build_status, invitation_statuses)
+    return generator.save_report(report)
+
+
+async def _run_checks(
+    checker: StatusChecker, emails: list[str]
+) -> tuple[BuildStatus | None, list[InvitationStatus]]:
+    """Run the build and invitation checks concurrently.
+
+    The two lookups hit independent endpoints, so the wall clock is the
+    slower of the two rather than their sum. Both stay synchronous
+    internally and run on worker threads via asyncio.to_thread.
+    """
+    build_task = asyncio.to_thread(checker.check_build_status)
+    if emails:
+        invite_task = asyncio.to_thread(checker.check_invitation_status, emails)
+        return await asyncio.gather(build_task, invite_task)
+    return await build_task, []
+
+
+def main() -> int:
+    """Check build and invitation status, then write a report."""
+    checker = StatusChecker()
+    if not checker.api_client.validate_credentials():
+        print_status_message(
+            "App Store Connect credentials not configured", StatusType.ERROR
+        )
+        return 1
+
+    example_emails = os.environ.get("TESTFLIGHT_TESTER_EMAILS", "").split(",")
+    example_emails = [e.strip() for e in example_emails if e.strip()]
+
+    print_status_message("Checking latest build...", StatusType.PROGRESS)
+    if example_emails:
+        print_status_message(
+            f"Checking invitation status for {len(example_emails)} testers...",
+            StatusType.PROGRESS,
+        )
+    build_status, invitation_statuses = asyncio.run(
+        _run_checks(checker, example_emails)
+    )
+
+    report_path = generate_status_report(build_status, invitation_statuses)
+    print_status_message(f"Report written to {report_path}", StatusType.SUCCESS)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
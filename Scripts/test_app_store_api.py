@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""Manual test script for the App Store Connect API client.
+
+Exercises credential validation, JWT generation, and the app/build
+lookups against the real API. Requires the APP_STORE_CONNECT_* env
+variables (see app_store_api.py). Run directly:
+
+    python3 Scripts/test_app_store_api.py
+"""
+
+from app_store_api import (
+    DEFAULT_BUNDLE_ID,
+    AppStoreConnectAPI,
+    generate_jwt_token,
+    get_app_id,
+    get_latest_build,
+)
+
+# One shared client for every test; the JWT cache and pooled session
+# then carry across calls instead of being rebuilt per test.
+API = AppStoreConnectAPI()
+
+# Summary-line constants indexed by bool(result).
+_ICONS = ("❌", "✅")
+_STATUS_TEXTS = ("FAIL", "PASS")
+
+
+def test_credentials_validation() -> bool:
+    """The configured credentials should point at an existing key file."""
+    ok = API.validate_credentials()
+    print(f"Credentials valid: {ok}")
+    return ok
+
+
+def test_jwt_generation() -> bool:
+    """Two back-to-back tokens should come from the cache, not re-signing."""
+    first = API.generate_jwt_token()
+    second = API.generate_jwt_token()
+    print(f"JWT generated ({len(first)} chars, cached={first == second})")
+    return bool(first) and first == second
+
+
+def test_app_id_lookup() -> bool:
+    """The project bundle id should resolve to an app id."""
+    app_id = API.get_app_id(DEFAULT_BUNDLE_ID)
+    print(f"App id for {DEFAULT_BUNDLE_ID}: {app_id}")
+    return app_id is not None
+
+
+def test_latest_build() -> bool:
+    """The app should have at least one uploaded build."""
+    app_id = API.get_app_id(DEFAULT_BUNDLE_ID)
+    if app_id is None:
+        return False
+    build = API.get_latest_build(app_id)
+    if build is None:
+        print("No builds found")
+        return False
+    print(f"Latest build: {build['attributes'].get('version')}")
+    return True
+
+
+def test_convenience_functions() -> bool:
+    """The module-level helpers should mirror the client methods."""
+    token = generate_jwt_token()
+    app_id = get_app_id(DEFAULT_BUNDLE_ID)
+    build = get_latest_build(app_id) if app_id else None
+    return bool(token) and app_id is not None and build is not None
+
+
+def main() -> int:
+    tests = [
+        ("Credentials validation", test_credentials_validation),
+        ("JWT generation", test_jwt_generation),
+        ("App id lookup", test_app_id_lookup),
+        ("Latest build", test_latest_build),
+        ("Convenience functions", test_convenience_functions),
+    ]
+    results = []
+    for name, test in tests:
+        print(f"\n--- {name} ---")
+        try:
+            results.append((name, test()))
+        except Exception as exc:
+            print(f"Exception: {exc}")
+            results.append((name, False))
+
+    print("\nSummary")
+    print("-------")
+    for name, result in results:
+        print(f"{_ICONS[result]} {_STATUS_TEXTS[result]} {name}")
+    return 0 if all(result for _, result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
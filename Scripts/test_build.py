@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+"""Build smoke test for the Leavn project.
+
+Runs an xcodebuild build for the iOS scheme and extracts error lines
+from the log. Complements Scripts/build.sh for quick local checks:
+
+    python3 Scripts/test_build.py
+"""
+
+import re
+import subprocess
+from collections import deque
+
+BUILD_COMMAND = (
+    "xcodebuild -scheme Leavn "
+    "-destination 'platform=iOS Simulator,name=iPhone 15' build"
+)
+
+# One alternation compiled at import: the log gets scanned once, not once
+# per error pattern, and there is no per-call compile/cache lookup.
+_ERR_RE = re.compile(
+    r"(?:error|fatal error): (.+)"
+    r"|Failed to (.+)"
+    r"|cannot find (.+)"
+    r"|No such (.+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+# A clean build log tail is plenty for diagnosis; the ring buffer caps
+# memory no matter how large the full log grows.
+TAIL_LINES = 20000
+
+
+def run_command(cmd: str, timeout: int = 1800) -> tuple[int, list[str], str]:
+    """Run a shell command, scanning its output as it streams.
+
+    Returns (exit code, extracted error messages, log tail). Lines are
+    matched against _ERR_RE as they arrive, so errors surface without
+    waiting for the build to finish and the full log never needs to be
+    held in memory.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    tail: deque[str] = deque(maxlen=TAIL_LINES)
+    errors: list[str] = []
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        tail.append(line)
+        match = _ERR_RE.search(line)
+        if match:
+            message = next((g for g in match.groups() if g), None)
+            if message:
+                errors.append(message.strip())
+    code = proc.wait(timeout=timeout)
+    return code, errors, "".join(tail)
+
+
+def extract_errors(output: str) -> list[str]:
+    """Pull the error messages out of an xcodebuild log."""
+    errors = []
+    for groups in _ERR_RE.findall(output):
+        message = next((g for g in groups if g), None)
+        if message:
+            errors.append(message.strip())
+    return errors
+
+
+def main() -> int:
+    print(f"Running: {BUILD_COMMAND}")
+    code, errors, _tail = run_command(BUILD_COMMAND)
+    if code == 0:
+        print("Build succeeded")
+        return 0
+    print(f"Build failed with exit code {code}; {len(errors)} error(s):")
+    for error in errors[:20]:
+        print(f"  - {error}")
+    if len(errors) > 20:
+        print(f"  ... and {len(errors) - 20} more")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
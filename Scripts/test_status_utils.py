@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+"""Comprehensive demo and test runner for status_utils.
+
+Exercises colored output, the progress bar, status checking, and report
+generation. Network-dependent phases skip themselves when the App Store
+Connect credentials are not configured. Run directly:
+
+    python3 Scripts/test_status_utils.py
+"""
+
+import itertools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from status_utils import (
+    BuildStatus,
+    InvitationStatus,
+    ProgressBar,
+    ReportGenerator,
+    StatusChecker,
+    StatusType,
+    check_build_status,
+    check_invitation_status,
+    colorize_text,
+    generate_status_report,
+    print_status_message,
+)
+
+# Summary-line constants indexed by bool(result); the loop then does
+# tuple lookups instead of three conditionals per line.
+_ICONS = ("❌", "✅")
+_STATUS_TEXTS = ("FAIL", "PASS")
+_SUMMARY_STATUSES = (StatusType.ERROR, StatusType.SUCCESS)
+
+
+def test_colored_output() -> bool:
+    """Every status type should render with its icon and color."""
+    for status_type in StatusType:
+        print_status_message(f"Sample {status_type.value} message", status_type)
+    print(colorize_text("Colorized text sample", StatusType.INFO))
+    return True
+
+
+def test_progress_bar() -> bool:
+    """The bar should advance to 100% and finish on its own line.
+
+    A fake clock drives the redraw throttle, so the phase exercises the
+    full render path without spending wall-clock time in sleeps.
+    """
+    bar = ProgressBar(total=25, clock=itertools.count(0, 0.1).__next__)
+    for _ in range(25):
+        bar.update(processed=1, successful=1)
+        bar.print_progress()
+
+    bar = ProgressBar(total=50, clock=itertools.count(0, 0.1).__next__)
+    for i in range(50):
+        if i % 5 == 0:
+            bar.update(processed=1, failed=1)
+        else:
+            bar.update(processed=1, successful=1)
+        bar.print_progress()
+    return True
+
+
+def test_status_checker_init() -> bool:
+    """A default checker should come with an API client attached."""
+    checker = StatusChecker()
+    return checker.api_client is not None
+
+
+def test_build_status_checking() -> bool:
+    """Live build lookup; skipped without credentials."""
+    checker = StatusChecker()
+    if not checker.api_client.validate_credentials():
+        print("Skipping: App Store Connect credentials not configured")
+        return True
+    build = checker.check_build_status()
+    if build is None:
+        print("No build found")
+        return True
+    print(f"Build {build.version} ({build.processing_state})")
+    return True
+
+
+def test_invitation_status_checking() -> bool:
+    """Mock a batch of invitation statuses and check the summary math."""
+    test_emails = [f"tester{i}@example.com" for i in range(10)]
+    invitation_statuses = []
+    _now = datetime.now()
+    for i, email in enumerate(test_emails):
+        if i % 3 == 0:
+            status, tester_id = "invited", f"tester-{i}"
+        elif i == 7:
+            status, tester_id = "error", None
+        else:
+            status, tester_id = "not_invited", None
+        invitation_statuses.append(
+            InvitationStatus(
+                email=email,
+                status=status,
+                tester_id=tester_id,
+                invited_date=None,
+                last_checked=_now,
+            )
+        )
+
+    counts = Counter(s.status for s in invitation_statuses)
+    invited = counts["invited"]
+    not_invited = counts["not_invited"]
+    errors = counts["error"]
+    print(f"invited={invited} not_invited={not_invited} errors={errors}")
+    return invited + not_invited + errors == len(test_emails)
+
+
+def test_report_generation() -> bool:
+    """Reports should save in both JSON and text formats."""
+    build = BuildStatus(
+        build_id="build-1",
+        version="1.0.0",
+        build_number="42",
+        processing_state="VALID",
+        uploaded_date=datetime.now(),
+    )
+    statuses = [
+        InvitationStatus(
+            email="tester@example.com",
+            status="invited",
+            tester_id="tester-1",
+            invited_date=None,
+            last_checked=datetime.now(),
+        )
+    ]
+    generator = ReportGenerator("test_reports")
+    report = generator.generate_report(build, statuses)
+    json_path = generator.save_report(report)
+    txt_generator = ReportGenerator("test_reports")
+    txt_path = txt_generator.save_report(report, filename="report.txt", format="txt")
+    print(f"Wrote {json_path} and {txt_path}")
+    return bool(json_path) and bool(txt_path)
+
+
+def test_convenience_functions() -> bool:
+    """The module-level helpers should exist and be callable."""
+    helpers = (check_build_status, check_invitation_status, generate_status_report)
+    return all(callable(helper) for helper in helpers)
+
+
+def _run_phase(name: str, phase) -> tuple[str, bool]:
+    try:
+        return name, phase()
+    except Exception as exc:
+        print(f"{name}: exception: {exc}")
+        return name, False
+
+
+def run_comprehensive_demo() -> int:
+    """Run the phases grouped by dependency and print a pass/fail summary.
+
+    Phases within a group are independent and run concurrently; groups
+    run in order so the local demos finish before the network phases and
+    report generation follows the status checks.
+    """
+    phase_groups = [
+        [
+            ("Colored output", test_colored_output),
+            ("Progress bar", test_progress_bar),
+            ("StatusChecker init", test_status_checker_init),
+        ],
+        [
+            ("Build status checking", test_build_status_checking),
+            ("Invitation status checking", test_invitation_status_checking),
+        ],
+        [
+            ("Report generation", test_report_generation),
+            ("Convenience functions", test_convenience_functions),
+        ],
+    ]
+    demo_results = []
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for group in phase_groups:
+            print("\n--- " + " / ".join(name for name, _ in group) + " ---")
+            demo_results.extend(executor.map(lambda item: _run_phase(*item), group))
+
+    print("\nSummary")
+    print("-------")
+    for name, result in demo_results:
+        print(
+            f"{_ICONS[result]} "
+            f"{colorize_text(_STATUS_TEXTS[result], _SUMMARY_STATUSES[result])} {name}"
+        )
+    return 0 if all(result for _, result in demo_results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(run_comprehensive_demo())
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+
+"""One-shot Grok chat interaction.
+
+Sends a short math prompt through the shared xAI client and prints the
+reply. Run directly:
+
+    python3 Scripts/xai_chat_interaction.py
+"""
+
+from xai_math_query import get_math_answer
+
+
+def main() -> int:
+    print(get_math_answer())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
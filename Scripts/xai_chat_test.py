@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+"""Smoke test for the Grok chat path.
+
+Asks Grok a question with a known answer and checks the reply. Requires
+XAI_API_KEY. Run directly:
+
+    python3 Scripts/xai_chat_test.py
+"""
+
+import os
+
+from xai_math_query import get_math_answer
+
+# Fail fast at import: a missing key aborts before any chat is built,
+# and repeated test runs skip the per-call env lookup and assert.
+API_KEY = os.environ["XAI_API_KEY"]
+
+
+def test_grok_math() -> bool:
+    """Grok should get basic arithmetic right."""
+    content = get_math_answer()
+    print(f"Response: {content}")
+    return "4" in content
+
+
+def main() -> int:
+    ok = test_grok_math()
+    print("✅ PASS" if ok else "❌ FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+"""Shared xAI API client for the Grok helper scripts.
+
+Exposes a process-wide client so every script run in the same process
+reuses one TLS connection and one XAI_API_KEY lookup. Requires:
+
+    export XAI_API_KEY=...
+"""
+
+import functools
+import os
+
+from xai_sdk import Client
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> Client:
+    """Return the process-wide xAI client, created on first use.
+
+    The env lookup and the client's TLS setup happen once; callers that
+    issue several chats amortize the handshake across all of them.
+    """
+    return Client(api_host="api.x.ai", api_key=os.environ["XAI_API_KEY"])
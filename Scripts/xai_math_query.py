@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+"""Shared Grok math query for the chat scripts.
+
+Both xai_chat_interaction.py and xai_chat_test.py ask the exact same
+question; this module issues it once per process and caches the answer,
+so running both together costs a single API round trip.
+"""
+
+import functools
+import io
+
+from xai_sdk.chat import system, user
+
+from xai_client import get_client
+
+
+@functools.lru_cache(maxsize=1)
+def get_math_answer() -> str:
+    """Ask Grok the shared math question, once per process."""
+    chat = get_client().chat.create(model="grok-3")
+    chat.append(system("You are a concise math tutor."))
+    chat.append(user("What is 2+2?"))
+    buffer = io.StringIO()
+    # stream() yields (accumulated Response, Chunk) pairs; only the
+    # chunk's new content matters here.
+    for _response, chunk in chat.stream():
+        buffer.write(chunk.content)
+    return buffer.getvalue()